@@ -199,14 +199,11 @@ def main():
     print('finished')
 
     K_arr = K_list[0]
-    phi_arr = phi_elec[0]
     print('K', K_list[0].shape, len(K_list))
     print('phi', phi_elec[0].shape, len(phi_elec))
 
-    for k in range(n - 1):
-        #K_arr = np.hstack((K_arr, K_list[k+1]))
-        #phi_arr = np.concatenate((phi_arr, phi_elec[k+1]), axis=1)
-        phi_arr = np.hstack((phi_arr, phi_elec[k + 1]))
+    # alle Spalten auf einmal stapeln statt hstack in der Schleife (jedes hstack kopiert das ganze Array)
+    phi_arr = np.hstack(phi_elec)
 
     G = 0
     C = phi_arr.T @ K_list[0] @ phi_arr / (v_value ** 2)
@@ -7,6 +7,7 @@ import gmsh
 import matplotlib.pyplot as plt
 import numpy as np
 from scipy.constants import epsilon_0, mu_0
+import scipy.sparse.linalg as sla
 
 from pyrit.geometry import Geometry
 from pyrit.material import Materials, Mat, Permittivity, Conductivity, Reluctivity
@@ -168,85 +169,86 @@ def main():
 
 
     X_mag = []
-    K_list = []
     a_mag = []
     current = 1
     n = 18
 
-    for i in range(2):
-        for j in range(n):
+    # Geometrie, Material, BC und omega bleiben gleich: Problem und Matrix nur einmal aufbauen,
+    # pro Iteration nur die Werte der Anregungen ändern
+    excis_left = [CurrentDensity(0) for _ in range(n)]  # List of excitations for the left side in the slot
+    excis_right = [CurrentDensity(0) for _ in range(n)]  # List of excitations for the right side in the slot
+    excis = excis_left + excis_right
 
-            vals_l = np.zeros(18)
-            vals_r = np.zeros(18)
-            print(f'iteration {(j+1)+n*i}')
+    problem = create_machine_slot_problem(excis_left, excis_right, show_gui=False, mesh_size_factor=0.03)
 
-            if i == 0:
-                vals_l[j] = current
-                excis_left = [CurrentDensity(l_i) for l_i in vals_l]  # List of excitations for the left side in the slot
-                excis_right = [CurrentDensity(r_i) for r_i in vals_r]  # List of excitations for the right side in the slot
+    mesh: TriMesh = problem.mesh
+    shape_function = TriCartesianEdgeShapeFunction(mesh)
+    problem.shape_function = shape_function
+
+    # region Build and solve the system
 
-            if i == 1:
-                vals_r[j] = current
-                excis_left = [CurrentDensity(l_i) for l_i in vals_l]  # List of excitations for the left side in the slot
-                excis_right = [CurrentDensity(l_r) for l_r in vals_r]  # List of excitations for the right side in the slot
-            print('vals_l', vals_l)
-            print('vals_r', vals_r)
+    curlcurl = shape_function.curlcurl_operator(problem.regions, problem.materials, Reluctivity)
+    #mass = shape_function.mass_matrix(problem.regions, problem.materials, Conductivity)
 
-            problem = create_machine_slot_problem(excis_left, excis_right, show_gui=False, mesh_size_factor=0.03)
+    #matrix = curlcurl + 1j * omega * mass
+    matrix = curlcurl
+    K = np.asarray(matrix.toarray())
+    load_list = []
 
-            mesh: TriMesh = problem.mesh
-            shape_function = TriCartesianEdgeShapeFunction(mesh)
-            problem.shape_function = shape_function
+    # erst alle linken, dann alle rechten Leiter anregen
+    for k in range(2 * n):
+        print(f'iteration {k + 1}')
+        for e_k, exci in enumerate(excis):
+            exci.value = current if e_k == k else 0
 
-            # region Build and solve the system
+        load = shape_function.load_vector(problem.regions, problem.excitations)
+        load_list.append(load)
+        X = load / current
+        X_mag.append(np.asarray(X.toarray()))
 
-            curlcurl = shape_function.curlcurl_operator(problem.regions, problem.materials, Reluctivity)
-            #mass = shape_function.mass_matrix(problem.regions, problem.materials, Conductivity)
+    # Matrix und BC sind für alle Anregungen gleich: nur einmal shrinken.
+    # Mit BCDirichlet(0) ist die reduzierte rechte Seite einfach load auf den freien Indizes
+    matrix_shrink, _, _, _, support_data = shape_function.shrink(matrix, load_list[0], problem, 1)
+    idx_dof = support_data['indices_not_on_dirichlet']
+    rhs_all = np.hstack([load.tocsr()[idx_dof].toarray().reshape(-1, 1) for load in load_list])
 
-            #matrix = curlcurl + 1j * omega * mass
-            matrix = curlcurl
-            load = shape_function.load_vector(problem.regions, problem.excitations)
+    # einmal faktorisieren und alle 2n rechten Seiten als (N, 2n) Matrix in einem Aufruf lösen
+    a_shrink_all = sla.splu(matrix_shrink.tocsc()).solve(rhs_all)
 
-            matrix_shrink, rhs_shrink, _, _, support_data = shape_function.shrink(matrix, load, problem, 1)
-            a_shrink, _ = type(problem).solve_linear_system(matrix_shrink.tocsr(), rhs_shrink.tocsr())
-            vector_potential = shape_function.inflate(a_shrink, problem, support_data)
+    for k in range(2 * n):
+        vector_potential = shape_function.inflate(a_shrink_all[:, k], problem, support_data)
 
-            vector_potential = np.reshape(vector_potential, (-1, 1))
-            X = load / current
-            X_mag.append(np.asarray(X.toarray()))
-            K_list.append(np.asarray(matrix.toarray()))
-            a_mag.append(np.asarray(vector_potential).reshape(-1, 1))
+        vector_potential = np.reshape(vector_potential, (-1, 1))
+        a_mag.append(np.asarray(vector_potential).reshape(-1, 1))
 
 
-            b_field = shape_function.curl(np.real(vector_potential))
-            if show_plot:
-                vector_real = np.real(vector_potential)
-                mesh.plot_scalar_field(vector_real, title='Distribution a')
-                mesh.plot_equilines(vector_real, title='Äquipotentiallinien a')
+        b_field = shape_function.curl(np.real(vector_potential))
+        if show_plot:
+            vector_real = np.real(vector_potential)
+            mesh.plot_scalar_field(vector_real, title='Distribution a')
+            mesh.plot_equilines(vector_real, title='Äquipotentiallinien a')
 
-                b_field = np.linalg.norm(b_field, axis=1)
-                mesh.plot_scalar_field(b_field, title="Absolute b field")
-                plt.show()
+            b_field = np.linalg.norm(b_field, axis=1)
+            mesh.plot_scalar_field(b_field, title="Absolute b field")
+            plt.show()
 
-    Xm_arr = X_mag[0].reshape(-1, 1)
-    am_arr = a_mag[0].reshape(-1, 1)
+    # alle Spalten auf einmal stapeln statt hstack in der Schleife (jedes hstack kopiert das ganze Array)
+    Xm_arr = np.hstack(X_mag)
+    am_arr = np.hstack(a_mag)
     print(am_arr.shape)
-    for k in range(n * 2 - 1):
-        Xm_arr = np.hstack((Xm_arr, X_mag[k+1]))
-        am_arr = np.hstack((am_arr, a_mag[k+1]))
 
-    print(K_list[0].shape)
+    print(K.shape)
 
     r_w = 1.1e-3
     sigma = 57.7e6
     R = np.eye(n * 2) * (1 / (sigma * np.pi * r_w ** 2))
 
     print('Resistance:', np.diag(R))
-    print('L2', am_arr.T @ K_list[0] @ am_arr / (current ** 2))
+    print('L2', am_arr.T @ K @ am_arr / (current ** 2))
 
 
     # cant invert
-    #print('L3', Xm_arr.T @ np.linalg.inv(K_list[0]) @ Xm_arr)
+    #print('L3', Xm_arr.T @ np.linalg.inv(K) @ Xm_arr)
 
     #np.savetxt('L_MachineSlot.csv', L, delimiter=',')
     L = Xm_arr.T @ am_arr / current
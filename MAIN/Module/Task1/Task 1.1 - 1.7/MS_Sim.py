@@ -10,32 +10,31 @@ import plot_properties
 from plot_properties import entity_in_physical_group
 show_plot = True
 
-def Knu_elem(k, shape_function, reluctivity_elems):
+def Knu_elems(shape_function, reluctivity_elems):
     '''
-    :param k:
     :param shape_function:
     :param reluctivity_elems:
-    :return:
+    :return: lokale Knu aller Elemente: num_elements x 3 x 3
     '''
 
     # integral(v rot(Wi) * rot(Wj) dV) =>
     # v (Wi dx,
     # sum over elements: ((b.T * b + c.T * c ) / (4 * area * l_z)) * reluctivity
-    # produces 3x172 * 172x3 = 3x3 output
+    # äußeres Produkt per broadcasting für alle Elemente auf einmal: (num_elem, 3, 1) * (num_elem, 1, 3)
     _, b, c, S = shape_function.get_coeff()
 
-    Knu_e = (np.array(b[k, :], ndmin=2).T @ np.array(b[k, :], ndmin=2) +
-           np.array(c[k, :], ndmin=2).T @ np.array(c[k, :], ndmin=2)) \
-                      / (4*S[k]*shape_function.depth)
-    return reluctivity_elems[k] * Knu_e
+    Knu_e = (b[:, :, None] * b[:, None, :] + c[:, :, None] * c[:, None, :]) \
+            / (4 * S * shape_function.depth)[:, None, None]
+    return reluctivity_elems[:, None, None] * Knu_e
 
 def calc_bfield(a, shape_function, msh):
 
     # bx = sum(c * A / 2 * area) / l_z , by = sum(b * A / 2 * area)  / (l_z)
     _, b, c, S = shape_function.get_coeff()
-    b_field = np.vstack([np.sum(c * a[msh.elem_to_node[:]] / (2 * S.reshape(-1, 1)), 1)
+    a_elem = a[msh.elem_to_node]
+    b_field = np.vstack([np.sum(c * a_elem / (2 * S.reshape(-1, 1)), 1)
                          / shape_function.depth,
-                         - np.sum(b * a[msh.elem_to_node[:]] / (2 * S.reshape(-1, 1)), 1)
+                         - np.sum(b * a_elem / (2 * S.reshape(-1, 1)), 1)
                          / shape_function.depth]).T
     return b_field
 
@@ -83,13 +82,16 @@ def main():
     #print(physical_groups[1][2])
     gmsh.finalize()
 
+    # msh.elem_to_node ist eine Property und wird bei jedem Zugriff neu berechnet: einmal holen
+    elem_to_node = msh.elem_to_node
+
     # indices for all elements by physical group
-    elem_shell = entity_in_physical_group(physical_groups, msh.elem_to_node, 'SHELL')
-    elem_wire = entity_in_physical_group(physical_groups, msh.elem_to_node, 'WIRE')
+    elem_shell = entity_in_physical_group(physical_groups, elem_to_node, 'SHELL')
+    elem_wire = entity_in_physical_group(physical_groups, elem_to_node, 'WIRE')
 
     # reluctivity in elem
     # Permeabilität = Durchlässigkeit Magnetfeld; Reluktanz=magn. Widerstand
-    reluctivity_elem = 1 / mu_0 * np.ones(msh.num_elements)  # [m/H]
+    reluctivity_elem = np.full(msh.num_elements, 1 / mu_0)  # [m/H]
     reluctivity_elem[elem_shell] = 1 / mu_shell  # [m/H] :
 
     # Task 4: setup the FE shape functions and assemble the stiffness matrix and load vector.
@@ -100,38 +102,18 @@ def main():
     shape_function.calc_coeff(msh)
 
     # Assign Knu for global indices: exactly taken from supporting remarks
-    idx_row = np.zeros((9 * msh.num_elements), dtype='int')
-    idx_col = np.zeros((9 * msh.num_elements), dtype='int')
-    elem_entries = np.zeros((9 * msh.num_elements))
-
-    # loop over elements
-    for k in range(msh.num_elements):
-
-        # idx für nodes von element k: (3, ): Wie zeile
-        global_indices = msh.elem_to_node[k, :]
-
-        # (3, 3) -> zeile dreimal untereinander
-        triple_global_indices = np.array([global_indices, global_indices, global_indices])
-
-        # np.reshape(triple_global_indices, (9)) schreibt in eine Zeile: (9, )
-        # schreibt nach und nach alle 9 indices nebeneinander und zwar wie folgt:
-        # immer 3 mal nebeinander: index_row [44 58 49 44 58 49 44 58 49 ...],
-        idx_row[9 * k:9 * k + 9] = np.reshape(triple_global_indices, (9))
+    # statt Schleife über die Elemente: alle 9 Einträge pro Element auf einmal
+    # index_row [44 58 49 44 58 49 44 58 49 ...] -> Zeile der nodes dreimal nebeneinander
+    idx_row = np.tile(elem_to_node, (1, 3)).reshape(-1)
 
-        # dann col: [44 44 44 58 58 58 49 49 49  ..]
-        idx_col[9 * k:9 * k + 9] = np.reshape(triple_global_indices.T, (9))
+    # dann col: [44 44 44 58 58 58 49 49 49  ..] -> jeder node dreimal
+    idx_col = np.repeat(elem_to_node, 3, axis=1).reshape(-1)
 
-        # lokales Knu: ((b.T * b + c.T * c ) / (4 * area * l_z)) * reluctivity -> produziert 3x3 output
+    # lokales Knu: ((b.T * b + c.T * c ) / (4 * area * l_z)) * reluctivity -> num_elem x 3 x 3
+    # aus 3x3 wird 1x9 je Element und das in elem_entries geschrieben
+    elem_entries = Knu_elems(shape_function, reluctivity_elem).reshape(-1)
 
-        # aus 3x3 wird 1x9 und das in elem_entries geschrieben
-        elem_entries[9 * k:9 * k + 9] = np.reshape(Knu_elem(k, shape_function, reluctivity_elem), (9))
-
-    # Zuweisung
-    idx_row = idx_row.T
-    idx_col = idx_col.tolist()
-    elem_entries = elem_entries.tolist()
-
-    # Knu Matrix: # [1/H]
+    # Knu Matrix: # [1/H] (Triplets direkt als numpy Arrays, kein Umweg über Python-Listen)
     Knu = csr_matrix((elem_entries, (idx_row, idx_col)))
     print('Knu shape', Knu, Knu.shape)
 
@@ -151,19 +133,12 @@ def main():
     x_elems = grid_currents / I
 
     # vector with values for current contribution of each element on the nodes.
-    values = np.zeros(msh.num_node)
-    x_values = np.zeros(msh.num_node)
-
-    # Iteration durch jedes Element j
-    # addiere Grid current von Element j zu Node i, wenn Node i Teil von Element i ist
+    # addiere Grid current von Element j zu Node i, wenn Node i Teil von Element j ist
     # Am Ende: Für jeden Node stehen dort die addierten Strombeiträge von jedem Element,
-    # in welchem sich Node j befindet
-
-    for i in range(3):
-        for j in range((msh.num_elements)):
-            idx_node = msh.elem_to_node[j, i]
-            values[idx_node] += grid_currents[j]
-            x_values[idx_node] += x_elems[j]
+    # in welchem sich Node i befindet (bincount summiert alle Beiträge in einem Durchlauf)
+    node_idx = elem_to_node.ravel()
+    values = np.bincount(node_idx, weights=np.repeat(grid_currents, 3), minlength=msh.num_node)
+    x_values = np.bincount(node_idx, weights=np.repeat(x_elems, 3), minlength=msh.num_node)
 
     # Zuweisung der Werte zu jeweiligen nodes in sparse format: num_nodes x 1
     j_grid = csr_matrix((values, (np.arange(msh.num_node), np.zeros(msh.num_node))), shape=(msh.num_node, 1))
@@ -193,16 +168,19 @@ def main():
     print('Magnetische Energie (analytisch Az, numerisch Knu)  :', W_magn_test, 'J')
 
     ##### Task 6: setup and solve the magnetostatic problem #####
-    a = np.zeros((msh.num_node, 1))  # Initialize vector of dofs
+    a = np.zeros(msh.num_node)  # Initialize vector of dofs (1-D, kein (n, 1) Umweg)
 
     # indices of GND are the boundary:
     idx_bc = physical_groups[3][2] # take only the indices out of dict: 28
 
-    value_bc = np.zeros((len(idx_bc), 1))
+    value_bc = np.zeros(len(idx_bc))
 
     # the indices where nothing is given: indices where we have to calculate a: 73 -> num_nodes - dof = index_constraint
     # restlichen indizes -> DoF: An diesen muss a berechnet werden
-    idx_dof = np.setdiff1d(np.arange(msh.num_node), idx_bc).tolist()
+    # Komplement über eine boolesche Maske statt setdiff1d (kein arange + Sortieren)
+    not_on_bc = np.ones(msh.num_node, dtype=bool)
+    not_on_bc[idx_bc] = False
+    idx_dof = np.flatnonzero(not_on_bc)
 
     # Reduce the system: Knu (num_nodes x num_nodes) --> (num_dof x num_dof): Remove the BC indizes -> known entries
     Knu_red = Knu[idx_dof, :]
@@ -215,11 +193,9 @@ def main():
     # Solve the system: Ka = j spsolver: Ax=b
     a_shrink = spsolve(Knu_red, rhs)
 
-    # Inflate A back to full size: num_nodes x 1
-    a_shrink = np.array(a_shrink, ndmin=2).T  # (73, ) only non boundary nodes
-    a[idx_dof] = a_shrink  # filled to (101,1)
+    # Inflate A back to full size: spsolve liefert schon (73, ), a bleibt (101, ) for every node
+    a[idx_dof] = a_shrink
     a[idx_bc] = value_bc
-    a = a.reshape(len(a))  # (101) for every node
 
     # L: Calculation
     print('Analytical L', analytic_sol.Inductance())
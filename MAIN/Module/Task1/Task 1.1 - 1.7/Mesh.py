@@ -32,7 +32,7 @@ class Mesh:
     @property
     def node_tag(self):
         # ID of nodes
-        node_tag = self.node_tag_data - np.ones(len(self.node_tag_data))
+        node_tag = self.node_tag_data - 1
         node_tag = node_tag.astype('int')
         np.put_along_axis(self.node ,np.c_[node_tag ,node_tag] ,self.node ,axis=0)
         return node_tag
@@ -58,8 +58,7 @@ class Mesh:
         # Associate elements (triangles) and their respective nodes.
         # Connection between elements and nodes.
         # Each line contains the indices of the contained nodes
-        elem_to_node = np.reshape(self.elements, (self.num_elements, 3)) - np.ones(
-            (self.num_elements, 1))
+        elem_to_node = np.reshape(self.elements, (self.num_elements, 3)) - 1
         elem_to_node = elem_to_node.astype('int')
         return elem_to_node
 
@@ -29,12 +29,9 @@ def entity_in_physical_group(physical_group_data: dict, entity2node: np.ndarray,
             if physical_group_data[p][1] == identifier:
                 identifier = p
 
-    out = -1 * np.ones(entity2node.shape[0], dtype=int)
-    for k in range(entity2node.shape[0]):
-        if np.isin(entity2node[k, :], physical_group_data[identifier][2]).all():
-            out[k] = k
-
-    return out[out != -1]
+    # ein np.isin über alle Entities statt einer Schleife über die Zeilen
+    in_group = np.isin(entity2node, physical_group_data[identifier][2]).all(axis=1)
+    return np.flatnonzero(in_group)
 
 def plot_mesh(msh):
     '''
@@ -69,7 +66,9 @@ def plot_regions_of_mesh(msh, physical_groups):
     elem_in_wire = entity_in_physical_group(physical_groups, msh.elem_to_node, 'WIRE')
 
     # Indices of edges on ground
-    edges_on_ground = entity_in_physical_group(physical_groups, msh.edge_to_node, 'GND')
+    # msh.edge_to_node läuft bei jedem Zugriff durch np.unique: nur einmal holen
+    edge_to_node = msh.edge_to_node
+    edges_on_ground = entity_in_physical_group(physical_groups, edge_to_node, 'GND')
     triang_shell = Triangulation(x, y, msh.elem_to_node[elem_in_shell])
     triang_wire = Triangulation(x, y, msh.elem_to_node[elem_in_wire])
 
@@ -81,8 +80,8 @@ def plot_regions_of_mesh(msh, physical_groups):
     plt.legend()
     for edge in edges_on_ground:
         # in i zeichnet von line i von x zu y koordinate
-        node_x = msh.node[msh.edge_to_node[edge, [0, 1]], 0]
-        node_y = msh.node[msh.edge_to_node[edge, [0, 1]], 1]
+        node_x = msh.node[edge_to_node[edge, [0, 1]], 0]
+        node_y = msh.node[edge_to_node[edge, [0, 1]], 1]
         line, = ax.plot(node_x, node_y, color='black')
     line.set_label('GND')
     plt.title('Regions plot')
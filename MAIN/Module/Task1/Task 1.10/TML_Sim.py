@@ -6,36 +6,62 @@ show_plot = True
 
 
 
+def _line_params(L, C, R, f, depth):
+    """
+    Gemeinsame Leitungsgrößen für A und B (f als Skalar oder Array).
+    Returns (bl, cosh(bl), sinh(bl), Z_char).
+    Verlustfrei (R = 0): bl = jx rein imaginär, cosh(jx) = cos(x), sinh(jx) = j*sin(x).
+    R darf auch ein Array sein, dann nur der allgemeine Weg."""
+    w = 2 * np.pi * f
+    Z_i = R + 1j * w * L
+    Y_i = 1j * w * C
+    bl = np.sqrt(Z_i * Y_i) * depth
+    if np.ndim(R) == 0 and R == 0:
+        x = bl.imag
+        return bl, np.cos(x) + 0j, 1j * np.sin(x), np.sqrt(Z_i / Y_i)
+    return bl, np.cosh(bl), np.sinh(bl), np.sqrt(Z_i / Y_i)
+
+
 def A(L, C, R, f, depth):
     """
     Kenne u0, i0: Suche u0, il
     The propagation matrix A."""
-    w = 2 * np.pi * f
-    Z_i = (R + (w * L) * 1j)
-    Y_i = (w * C) * 1j
-    beta = np.sqrt(Z_i * Y_i)
-    bl = beta * depth
-    Z_char = np.sqrt(Z_i / Y_i)
-    Y = 1 / Z_char
-    return np.array([
-        [np.cosh(bl), -Z_char * np.sinh(bl)],
-        [- (1 / Z_char) * np.sinh(bl), np.cosh(bl)]
-    ])
+    return A_batch(_line_params(L, C, R, f, depth))
 
 def B(L, C, R, f, depth):
     """
     Kenn u0, ul: Suche i0, il
     The admittance matrix B."""
-    w = 2 * np.pi * f
-    Z_i = (R + (w * L) * 1j)
-    Y_i = (w * C) * 1j
-    beta = np.sqrt(Z_i * Y_i)
-    bl = beta * depth
-    Y_ch = np.sqrt(Y_i / Z_i)
-    return np.array([
-        [np.cosh(bl), -1],
-        [1, -np.cosh(bl)]
-    ]) * Y_ch / np.sinh(bl)
+    return B_batch(_line_params(L, C, R, f, depth))
+
+
+def A_batch(line_params):
+    """
+    Propagation matrix A für alle Frequenzen auf einmal.
+    line_params: Tupel (bl, ch, sh, Z_char) aus _line_params, wird nicht neu berechnet.
+    Returns an array of shape np.shape(ch) + (2, 2), d.h. die Form des f, das an _line_params ging."""
+    _, ch, sh, Z_char = line_params
+    out = np.empty(np.shape(ch) + (2, 2), dtype=np.complex128)
+    out[..., 0, 0] = ch
+    out[..., 0, 1] = -Z_char * sh
+    out[..., 1, 0] = -sh / Z_char
+    out[..., 1, 1] = ch
+    return out
+
+
+def B_batch(line_params):
+    """
+    Admittance matrix B für alle Frequenzen auf einmal.
+    line_params: Tupel (bl, ch, sh, Z_char) aus _line_params, wird nicht neu berechnet.
+    Returns an array of shape np.shape(ch) + (2, 2), d.h. die Form des f, das an _line_params ging."""
+    _, ch, sh, Z_char = line_params
+    Y_sh = 1 / (Z_char * sh)
+    out = np.empty(np.shape(ch) + (2, 2), dtype=np.complex128)
+    out[..., 0, 0] = ch * Y_sh
+    out[..., 0, 1] = -Y_sh
+    out[..., 1, 0] = Y_sh
+    out[..., 1, 1] = -ch * Y_sh
+    return out
 
 
 def main():
@@ -65,33 +91,17 @@ def main():
     R = 1 / (sigma * np.pi * r_1 ** 2)
     print('R', R)
 
-    # impedance matrix
-    Z = []
-    Y = []
-    w = []
-    beta = []
-    Z_char = []
     v_phase = 1 / np.sqrt(mu_0 * 5 * eps_0)
-
-
-    wave_len = []
     f = np.logspace(0, 5, 100)
 
-    # for loop, um Z_char, lambda für verschiedene f zu berechnen.
-    for i in range(len(f)):
-        w_i = 2 * np.pi * f[i]
-        w.append(w_i)
-        # impedance matrix
-        Z_i = (R + (w_i * L) * 1j)
-        Z.append(Z_i)
-
-        Y_i = (w_i * C) * 1j
-        Y.append(Y_i)
-        beta.append(np.sqrt(Z_i * Y_i))
-        Z_char.append(np.sqrt(Z_i / Y_i))
-        wave_len.append(v_phase / f[i])
-
-
+    # Z_char, lambda für alle f auf einmal (vektorisiert) berechnen.
+    # Der Sweep braucht nur Z_char: kein cosh/sinh über alle f wie in _line_params
+    w = 2 * np.pi * f
+    # impedance matrix
+    Z = R + 1j * w * L
+    Y = 1j * w * C
+    Z_char = np.sqrt(Z / Y)
+    wave_len = v_phase / f
 
     Z_abs = np.abs(Z_char)
     Z_ang = np.angle(Z_char, deg=True)
@@ -139,9 +149,11 @@ def main():
 
     # propagation and admittance matrix for f_3 = 1kHz: f up => absolute Values up
     f_3 = 1e3
-    prop_mat = A(L, C, R, f_3, depth)
+    # Leitungsgrößen nur einmal für A und B berechnen
+    params = _line_params(L, C, R, f_3, depth)
+    prop_mat = A_batch(params)
     print('propagation matrix', prop_mat)
-    adm_mat = B(L, C, R, f_3, depth)
+    adm_mat = B_batch(params)
     print('Admittance matrix', adm_mat)
     #         If set to true the values are smoothend by a Savitzky-Golay filter implemented in scipy:
     #         :py:func:'scipy.signal.savgol_filter'.
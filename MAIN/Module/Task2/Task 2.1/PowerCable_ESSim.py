@@ -40,10 +40,10 @@ def main():
 
 
         # get indices with boundary conditions to shrink phi
-        regions_of_bc = problem.boundary_conditions.regions_of_bc(problem.regions)
-        '''Dict with the key being the ID of a boundary condition and the value being e list of IDs of the regions that
-            have this boundary condition.'''
-        '''keyslst = list(regions_of_bc.keys())
+        '''regions_of_bc = problem.boundary_conditions.regions_of_bc(problem.regions)
+        # Dict with the key being the ID of a boundary condition and the value being e list of IDs of the regions that
+        # have this boundary condition.
+        keyslst = list(regions_of_bc.keys())
         print(keyslst, keyslst[2])
 
         # floating bc
@@ -67,10 +67,9 @@ def main():
 
         # get indices with boundary conditions to shrink phi
         lst_bc = get_bc_idx(i)
-        phi_dof = np.copy(solution.potential)
-        for bc_i in (lst_bc):
-            phi_dof[bc_i] = 0
-        Xu = (solution.potential - phi_dof) / u_val
+        # Xu: Potential nur auf den BC-Knoten, sonst 0 (ohne Kopie von phi)
+        Xu = np.zeros_like(solution.potential)
+        Xu[lst_bc] = solution.potential[lst_bc] / u_val
         Xu_lst.append(Xu.reshape(-1, 1))
 
         # Plots the magnetic flux density, style options are 'arrows', 'abs', 'stream'.
@@ -120,20 +120,20 @@ np.savetxt('idx_d_lst3.csv', (idx_d_lst3), fmt='%i', delimiter=",")'''
 def get_bc_idx(i):
     if i == 0:
         idx_d_lst1 = np.loadtxt("/Users/paulheller/Library/Mobile Documents/com~apple~CloudDocs/TU Darmstadt 4M/Forschungspraxis/Data/idx_d_lst1.csv",
-            delimiter=",", dtype=int).tolist()
+            delimiter=",", dtype=int, ndmin=1)
         idx_fl_lst1 = np.loadtxt("/Users/paulheller/Library/Mobile Documents/com~apple~CloudDocs/TU Darmstadt 4M/Forschungspraxis/Data/idx_fl_lst1.csv",
-            delimiter=",", dtype=int).tolist()
-        return np.hstack((idx_fl_lst1, idx_d_lst1))
+            delimiter=",", dtype=int, ndmin=1)
+        return np.concatenate((idx_fl_lst1, idx_d_lst1))
     if i == 1:
         idx_d_lst2 = np.loadtxt("/Users/paulheller/Library/Mobile Documents/com~apple~CloudDocs/TU Darmstadt 4M/Forschungspraxis/Data/idx_d_lst2.csv",
-            delimiter=",", dtype=int).tolist()
+            delimiter=",", dtype=int, ndmin=1)
         idx_fl_lst2 = np.loadtxt("/Users/paulheller/Library/Mobile Documents/com~apple~CloudDocs/TU Darmstadt 4M/Forschungspraxis/Data/idx_fl_lst2.csv",
-            delimiter=",", dtype=int).tolist()
-        return np.hstack((idx_fl_lst2, idx_d_lst2))
+            delimiter=",", dtype=int, ndmin=1)
+        return np.concatenate((idx_fl_lst2, idx_d_lst2))
     if i == 2:
         idx_d_lst3 = np.loadtxt("/Users/paulheller/Library/Mobile Documents/com~apple~CloudDocs/TU Darmstadt 4M/Forschungspraxis/Data/idx_d_lst3.csv",
-            delimiter=",", dtype=int).tolist()
+            delimiter=",", dtype=int, ndmin=1)
         idx_fl_lst3 = np.loadtxt("/Users/paulheller/Library/Mobile Documents/com~apple~CloudDocs/TU Darmstadt 4M/Forschungspraxis/Data/idx_fl_lst3.csv",
-            delimiter=",", dtype=int).tolist()
+            delimiter=",", dtype=int, ndmin=1)
 
-        return np.hstack((idx_fl_lst3, idx_d_lst3))
+        return np.concatenate((idx_fl_lst3, idx_d_lst3))
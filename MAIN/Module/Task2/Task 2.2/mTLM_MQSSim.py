@@ -1,5 +1,6 @@
 import numpy as np
 import numpy.linalg as la
+import scipy.sparse.linalg as sla
 from matplotlib import pyplot as plt
 from dataclasses import dataclass
 from pyrit.geometry import Geometry, Circle, Surface
@@ -184,30 +185,45 @@ def main():
     bcs = []
     # Zur Berechnung von
 
-    for i in range(Ti.shape[0]):
+    # Geometrie, Material, BC und omega sind für alle Moden gleich:
+    # Problem und Matrix nur einmal aufbauen, pro Mode nur die Anregung ändern
+    power_cable = PowerCable(current=Ti_real[:, 0])
+    problem = power_cable.create_problem(mesh_size_factor=0.2, magn=True, show_gui=False) # bcs
+    mesh: TriMesh = problem.mesh
+    shape_function = TriCartesianEdgeShapeFunction(mesh)
+    problem.shape_function = shape_function
+
+    # ValueError: Matrix A is singular, because it contains empty row(s)
+    curlcurl = shape_function.curlcurl_operator(problem.regions, problem.materials, Reluctivity)
+    mass = shape_function.mass_matrix(problem.regions, problem.materials, Conductivity)
 
-        power_cable = PowerCable(current=Ti_real[:, i])
-        problem = power_cable.create_problem(mesh_size_factor=0.2, magn=True, show_gui=False) # bcs
-        mesh: TriMesh = problem.mesh
-        shape_function = TriCartesianEdgeShapeFunction(mesh)
-        problem.shape_function = shape_function
+    matrix = curlcurl + 1j * omega * mass
+    load_list = []
 
-        # ValueError: Matrix A is singular, because it contains empty row(s)
-        curlcurl = shape_function.curlcurl_operator(problem.regions, problem.materials, Reluctivity)
-        mass = shape_function.mass_matrix(problem.regions, problem.materials, Conductivity)
+    for i in range(Ti.shape[0]):
 
-        matrix = curlcurl + 1j * omega * mass
+        power_cable.current = Ti_real[:, i]
+        for e_i, exci in enumerate(problem.excitations):
+            exci.value = power_cable.current_density[e_i]
         load1 = shape_function.load_vector(problem.regions, problem.excitations)
         for e_i, exci in enumerate(problem.excitations):
             exci.value = Ti_imag[e_i, i]
 
         # da komplexer Strom
         load2 = shape_function.load_vector(problem.regions, problem.excitations)
-        load = load1 + 1j * load2
+        load_list.append(load1 + 1j * load2)
 
-        matrix_shrink, rhs_shrink, _, _, support_data = shape_function.shrink(matrix, load, problem, 1)
-        a_shrink, _ = type(problem).solve_linear_system(matrix_shrink.tocsr(), rhs_shrink.tocsr())
-        vector_potential = shape_function.inflate(a_shrink, problem, support_data)
+    # Matrix und BC sind für alle Moden gleich: nur einmal shrinken.
+    # Mit BCDirichlet(0) ist die reduzierte rechte Seite einfach load auf den freien Indizes
+    matrix_shrink, _, _, _, support_data = shape_function.shrink(matrix, load_list[0], problem, 1)
+    idx_dof = support_data['indices_not_on_dirichlet']
+    rhs_all = np.hstack([load.tocsr()[idx_dof].toarray().reshape(-1, 1) for load in load_list])
+
+    # einmal faktorisieren und alle Moden als (N, 3) rechte Seite in einem Aufruf lösen
+    a_shrink_all = sla.splu(matrix_shrink.tocsc()).solve(rhs_all)
+
+    for i in range(Ti.shape[0]):
+        vector_potential = shape_function.inflate(a_shrink_all[:, i], problem, support_data)
         real_vp = np.real(vector_potential)
 
         b_field = shape_function.curl(real_vp)
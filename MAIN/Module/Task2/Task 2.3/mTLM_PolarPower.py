@@ -14,10 +14,14 @@ Task 2.3b) Berechnung von Power out über Frequenz
 def Ak_m(Zkm_ch, bkm, l):
     """Calculates the local modal propagation matrix for the given tlm parameters."""
     bl = bkm * l
-    return np.array([
-        [np.cosh(bl), -Zkm_ch * np.sinh(bl)],
-        [-np.sinh(bl) / Zkm_ch, np.cosh(bl)]
-    ])
+    ch = np.cosh(bl)
+    sh = np.sinh(bl)
+    ak = np.empty((2, 2), dtype=np.complex128)
+    ak[0, 0] = ch
+    ak[0, 1] = -Zkm_ch * sh
+    ak[1, 0] = -sh / Zkm_ch
+    ak[1, 1] = ch
+    return ak
 def propMatrix(Zm_ch, bm, l_3, Tu, Ti):
     # Modale Propagationsmatrix:
     ak_m = [Ak_m(Zkm, bkm, l_3) for Zkm, bkm in zip(Zm_ch, bm)]